@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-import re
 from typing import Any
 
 import voluptuous as vol
@@ -32,25 +31,82 @@ from .const import (
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
     MIN_UPDATE_INTERVAL,
-    SENSOR_CONFIGS,
+    SENSOR_PAIRS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-# OpenSenseMap box IDs are 24-character hex strings
-BOX_ID_PATTERN = re.compile(r"^[a-fA-F0-9]{24}$")
-# Sensor IDs are also 24-character hex strings
-SENSOR_ID_PATTERN = re.compile(r"^[a-fA-F0-9]{24}$")
+# OpenSenseMap box and sensor IDs are 24-character hex strings
+ID_LENGTH = 24
+_HEX = frozenset("0123456789abcdefABCDEF")
+
+# Form schemas and selectors are invariant, so build them once
+_ENTITY_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="sensor")
+)
+
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_BOX_ID): str,
+        vol.Optional(CONF_ACCESS_TOKEN): str,
+    }
+)
+
+_SENSORS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_ENTITY_PM25): _ENTITY_SELECTOR,
+        vol.Optional(CONF_SENSOR_ID_PM25): str,
+        vol.Optional(CONF_ENTITY_PM10): _ENTITY_SELECTOR,
+        vol.Optional(CONF_SENSOR_ID_PM10): str,
+        vol.Optional(CONF_ENTITY_TEMPERATURE): _ENTITY_SELECTOR,
+        vol.Optional(CONF_SENSOR_ID_TEMPERATURE): str,
+        vol.Optional(CONF_ENTITY_HUMIDITY): _ENTITY_SELECTOR,
+        vol.Optional(CONF_SENSOR_ID_HUMIDITY): str,
+        vol.Optional(CONF_ENTITY_PRESSURE): _ENTITY_SELECTOR,
+        vol.Optional(CONF_SENSOR_ID_PRESSURE): str,
+    }
+)
+
+_OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(
+            CONF_UPDATE_INTERVAL,
+            default=DEFAULT_UPDATE_INTERVAL,
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=MIN_UPDATE_INTERVAL,
+                max=3600,
+                step=60,
+                unit_of_measurement="seconds",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Optional(CONF_DEBUG_MODE, default=False): bool,
+    }
+)
+
+# Options flow template - current values are applied as suggested values
+_OPTIONS_INIT_SCHEMA = _SENSORS_SCHEMA.extend(_OPTIONS_SCHEMA.schema)
+
+
+def _is_hex_id(value: str) -> bool:
+    """Return True if value is a 24-character hex string."""
+    if len(value) != ID_LENGTH:
+        return False
+    for char in value:
+        if char not in _HEX:
+            return False
+    return True
 
 
 def validate_box_id(box_id: str) -> bool:
     """Validate the box ID format."""
-    return bool(BOX_ID_PATTERN.match(box_id))
+    return _is_hex_id(box_id)
 
 
 def validate_sensor_id(sensor_id: str) -> bool:
     """Validate the sensor ID format."""
-    return bool(SENSOR_ID_PATTERN.match(sensor_id))
+    return _is_hex_id(sensor_id)
 
 
 class OpenSenseMapConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -87,12 +143,7 @@ class OpenSenseMapConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_BOX_ID): str,
-                    vol.Optional(CONF_ACCESS_TOKEN): str,
-                }
-            ),
+            data_schema=_USER_SCHEMA,
             errors=errors,
         )
 
@@ -106,7 +157,7 @@ class OpenSenseMapConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # Check that at least one pair is configured
             has_valid_pair = False
 
-            for sensor_id_key, entity_key, label, _ in SENSOR_CONFIGS:
+            for sensor_id_key, entity_key in SENSOR_PAIRS:
                 sensor_id = user_input.get(sensor_id_key, "").strip()
                 entity_id = user_input.get(entity_key)
 
@@ -126,30 +177,7 @@ class OpenSenseMapConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="sensors",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(CONF_ENTITY_PM25): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="sensor")
-                    ),
-                    vol.Optional(CONF_SENSOR_ID_PM25): str,
-                    vol.Optional(CONF_ENTITY_PM10): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="sensor")
-                    ),
-                    vol.Optional(CONF_SENSOR_ID_PM10): str,
-                    vol.Optional(CONF_ENTITY_TEMPERATURE): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="sensor")
-                    ),
-                    vol.Optional(CONF_SENSOR_ID_TEMPERATURE): str,
-                    vol.Optional(CONF_ENTITY_HUMIDITY): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="sensor")
-                    ),
-                    vol.Optional(CONF_SENSOR_ID_HUMIDITY): str,
-                    vol.Optional(CONF_ENTITY_PRESSURE): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="sensor")
-                    ),
-                    vol.Optional(CONF_SENSOR_ID_PRESSURE): str,
-                }
-            ),
+            data_schema=_SENSORS_SCHEMA,
             errors=errors,
         )
 
@@ -170,23 +198,7 @@ class OpenSenseMapConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="options",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        CONF_UPDATE_INTERVAL,
-                        default=DEFAULT_UPDATE_INTERVAL,
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=MIN_UPDATE_INTERVAL,
-                            max=3600,
-                            step=60,
-                            unit_of_measurement="seconds",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                    vol.Optional(CONF_DEBUG_MODE, default=False): bool,
-                }
-            ),
+            data_schema=_OPTIONS_SCHEMA,
         )
 
     @staticmethod
@@ -212,7 +224,7 @@ class OpenSenseMapOptionsFlow(config_entries.OptionsFlow):
             valid_data: dict[str, Any] = {}
             has_valid_pair = False
 
-            for sensor_id_key, entity_key, label, _ in SENSOR_CONFIGS:
+            for sensor_id_key, entity_key in SENSOR_PAIRS:
                 sensor_id = user_input.get(sensor_id_key, "").strip() if user_input.get(sensor_id_key) else ""
                 entity_id = user_input.get(entity_key)
 
@@ -233,45 +245,10 @@ class OpenSenseMapOptionsFlow(config_entries.OptionsFlow):
         # Get current values - merge data and options
         current_data = {**self.config_entry.data, **self.config_entry.options}
 
-        # Create entity selector
-        entity_selector = selector.EntitySelector(
-            selector.EntitySelectorConfig(domain="sensor")
-        )
-
-        schema_dict: dict[vol.Marker, Any] = {}
-
-        for sensor_id_key, entity_key, label, _ in SENSOR_CONFIGS:
-            current_sensor_id = current_data.get(sensor_id_key, "")
-            current_entity = current_data.get(entity_key)
-
-            schema_dict[vol.Optional(
-                entity_key,
-                description={"suggested_value": current_entity},
-            )] = entity_selector
-            schema_dict[vol.Optional(
-                sensor_id_key,
-                description={"suggested_value": current_sensor_id},
-            )] = str
-
-        current_interval = current_data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
-        current_debug = current_data.get(CONF_DEBUG_MODE, False)
-
-        schema_dict[vol.Optional(
-            CONF_UPDATE_INTERVAL,
-            default=current_interval,
-        )] = selector.NumberSelector(
-            selector.NumberSelectorConfig(
-                min=MIN_UPDATE_INTERVAL,
-                max=3600,
-                step=60,
-                unit_of_measurement="seconds",
-                mode=selector.NumberSelectorMode.BOX,
-            )
-        )
-        schema_dict[vol.Optional(CONF_DEBUG_MODE, default=current_debug)] = bool
-
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(schema_dict),
+            data_schema=self.add_suggested_values_to_schema(
+                _OPTIONS_INIT_SCHEMA, current_data
+            ),
             errors=errors,
         )
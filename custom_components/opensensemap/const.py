@@ -1,5 +1,6 @@
 """Constants for the OpenSenseMap integration."""
 from datetime import timedelta
+from typing import Final
 
 DOMAIN = "opensensemap"
 
@@ -38,26 +39,37 @@ MEASUREMENT_HUMIDITY = "humidity"
 MEASUREMENT_PRESSURE = "pressure"
 
 # Sensor configurations - pairs of (sensor_id_key, entity_key, label, measurement_type)
-SENSOR_CONFIGS = [
+SENSOR_CONFIGS: Final[tuple[tuple[str, str, str, str], ...]] = (
     (CONF_SENSOR_ID_PM25, CONF_ENTITY_PM25, "PM2.5", MEASUREMENT_PM),
     (CONF_SENSOR_ID_PM10, CONF_ENTITY_PM10, "PM10", MEASUREMENT_PM),
     (CONF_SENSOR_ID_TEMPERATURE, CONF_ENTITY_TEMPERATURE, "Temperature", MEASUREMENT_TEMPERATURE),
     (CONF_SENSOR_ID_HUMIDITY, CONF_ENTITY_HUMIDITY, "Humidity", MEASUREMENT_HUMIDITY),
     (CONF_SENSOR_ID_PRESSURE, CONF_ENTITY_PRESSURE, "Pressure", MEASUREMENT_PRESSURE),
-]
+)
 
-ALL_SENSOR_ID_KEYS = [
+# (sensor_id_key, entity_key) pairs for config flow validation
+SENSOR_PAIRS: Final[tuple[tuple[str, str], ...]] = tuple(
+    (sensor_id_key, entity_key) for sensor_id_key, entity_key, _, _ in SENSOR_CONFIGS
+)
+
+# (sensor_id_key, entity_key, measurement_type) for the coordinator
+SENSOR_TRIPLES: Final[tuple[tuple[str, str, str], ...]] = tuple(
+    (sensor_id_key, entity_key, measurement_type)
+    for sensor_id_key, entity_key, _, measurement_type in SENSOR_CONFIGS
+)
+
+ALL_SENSOR_ID_KEYS: Final[tuple[str, ...]] = (
     CONF_SENSOR_ID_PM25,
     CONF_SENSOR_ID_PM10,
     CONF_SENSOR_ID_TEMPERATURE,
     CONF_SENSOR_ID_HUMIDITY,
     CONF_SENSOR_ID_PRESSURE,
-]
+)
 
-ALL_ENTITY_KEYS = [
+ALL_ENTITY_KEYS: Final[tuple[str, ...]] = (
     CONF_ENTITY_PM25,
     CONF_ENTITY_PM10,
     CONF_ENTITY_TEMPERATURE,
     CONF_ENTITY_HUMIDITY,
     CONF_ENTITY_PRESSURE,
-]
+)
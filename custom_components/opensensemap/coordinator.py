@@ -2,15 +2,20 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 from datetime import datetime, timedelta
 import logging
 from typing import Any
 
 import aiohttp
+import orjson
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
 
 from .const import (
     API_URL,
@@ -23,7 +28,7 @@ from .const import (
     MEASUREMENT_HUMIDITY,
     MEASUREMENT_PRESSURE,
     MEASUREMENT_TEMPERATURE,
-    SENSOR_CONFIGS,
+    SENSOR_TRIPLES,
     SOFTWARE_TYPE,
 )
 
@@ -31,6 +36,62 @@ _LOGGER = logging.getLogger(__name__)
 
 HTTP_TIMEOUT = 30
 
+# HTTP status codes treated as a successful upload
+_OK_STATUSES = frozenset((200, 201, 202, 204))
+
+# Entity states that mean no usable reading is available
+_UNAVAILABLE_STATES = frozenset((STATE_UNKNOWN, STATE_UNAVAILABLE, ""))
+
+
+def _fahrenheit_to_celsius(value: float) -> float:
+    """Convert a temperature from °F to °C."""
+    return (value - 32) * 5 / 9
+
+
+def _hpa_to_pa(value: float) -> float:
+    """Convert a pressure from hPa (or mbar) to Pa."""
+    return value * 100
+
+
+def _inhg_to_pa(value: float) -> float:
+    """Convert a pressure from inHg to Pa."""
+    return value * 3386.39
+
+
+def _psi_to_pa(value: float) -> float:
+    """Convert a pressure from psi to Pa."""
+    return value * 6894.76
+
+
+def _fraction_to_percent(value: float) -> float:
+    """Convert a humidity given as a 0-1 fraction to a percentage."""
+    return value * 100 if value <= 1 else value
+
+
+_Converter = Callable[[float], float]
+
+# Unit conversions to the OpenSenseMap unit, per measurement type and unit.
+# Pressure without a unit is assumed hPa; values already in Pa and
+# temperatures in °C need no conversion.
+_UNIT_CONVERSIONS: dict[str, dict[str | None, _Converter]] = {
+    MEASUREMENT_TEMPERATURE: {
+        "°F": _fahrenheit_to_celsius,
+        "F": _fahrenheit_to_celsius,
+    },
+    MEASUREMENT_PRESSURE: {
+        "hPa": _hpa_to_pa,
+        "mbar": _hpa_to_pa,
+        "": _hpa_to_pa,
+        "inHg": _inhg_to_pa,
+        "psi": _psi_to_pa,
+    },
+}
+
+# Conversions applied when no unit-specific conversion matches
+_DEFAULT_CONVERSIONS: dict[str, _Converter] = {
+    MEASUREMENT_HUMIDITY: _fraction_to_percent,
+}
+
 
 class OpenSenseMapCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator for pushing data to OpenSenseMap API."""
@@ -40,7 +101,20 @@ class OpenSenseMapCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.entry = entry
         self._box_id = entry.data[CONF_BOX_ID]
         self._access_token = entry.data.get(CONF_ACCESS_TOKEN)
-        self._session: aiohttp.ClientSession | None = None
+        self._session = async_get_clientsession(hass)
+
+        # Request URL and headers are invariant for the lifetime of the entry
+        self._url = API_URL.format(box_id=self._box_id)
+        self._headers: dict[str, str] = {
+            "Content-Type": "application/json; charset=utf-8",
+            "User-Agent": f"{SOFTWARE_TYPE}/1.0.0",
+        }
+        if self._access_token:
+            self._headers["Authorization"] = f"Bearer {self._access_token}"
+        # Headers as shown in debug output, with the access token masked
+        self._masked_headers: dict[str, str] = {
+            k: v if k != "Authorization" else "***" for k, v in self._headers.items()
+        }
 
         # Status tracking
         self.last_upload: datetime | None = None
@@ -48,11 +122,28 @@ class OpenSenseMapCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.upload_count: int = 0
         self.last_request_data: dict[str, Any] | None = None
 
+        # Merged configuration - options take precedence over data. Options
+        # changes reload the entry, so this is rebuilt with the coordinator.
+        self._config: dict[str, Any] = {**entry.data, **entry.options}
+
+        # Configured sensors as (sensor_id, entity_id, measurement_type,
+        # unit_conversions, default_conversion)
+        self._active: list[
+            tuple[str, str, str, dict[str | None, _Converter], _Converter | None]
+        ] = [
+            (
+                self._config[sensor_id_key],
+                self._config[entity_key],
+                measurement_type,
+                _UNIT_CONVERSIONS.get(measurement_type, {}),
+                _DEFAULT_CONVERSIONS.get(measurement_type),
+            )
+            for sensor_id_key, entity_key, measurement_type in SENSOR_TRIPLES
+            if self._config.get(sensor_id_key) and self._config.get(entity_key)
+        ]
+
         # Get update interval
-        interval = entry.options.get(
-            CONF_UPDATE_INTERVAL,
-            entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
-        )
+        interval = self._config.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
 
         super().__init__(
             hass,
@@ -64,10 +155,7 @@ class OpenSenseMapCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     @property
     def debug_mode(self) -> bool:
         """Return whether debug mode is enabled."""
-        return self.entry.options.get(
-            CONF_DEBUG_MODE,
-            self.entry.data.get(CONF_DEBUG_MODE, False),
-        )
+        return self._config.get(CONF_DEBUG_MODE, False)
 
     @property
     def next_upload(self) -> datetime | None:
@@ -76,35 +164,61 @@ class OpenSenseMapCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return self.last_upload + self.update_interval
         return None
 
-    def _all_sensors_available(self) -> tuple[bool, list[str]]:
-        """Check if all configured sensors are available.
+    def _collect_and_check(self) -> tuple[dict[str, str], list[str]]:
+        """Collect sensor values and check availability in a single pass.
 
-        Returns a tuple of (all_available, list_of_unavailable_entities).
+        Returns a tuple of (sensor_data, list_of_unavailable_entities).
         """
-        config_data = self.entry.data
-        options = self.entry.options
+        data: dict[str, str] = {}
         unavailable: list[str] = []
+        # Bind lookups used on every iteration as locals
+        get_state = self.hass.states.get
+        log_debug = _LOGGER.debug
+        unavailable_states = _UNAVAILABLE_STATES
+
+        for (
+            sensor_id,
+            entity_id,
+            measurement_type,
+            unit_conversions,
+            default_conversion,
+        ) in self._active:
+            state = get_state(entity_id)
+            if state is None or state.state in unavailable_states:
+                unavailable.append(entity_id)
+                continue
 
-        for sensor_id_key, entity_key, label, measurement_type in SENSOR_CONFIGS:
-            sensor_id = options.get(sensor_id_key, config_data.get(sensor_id_key))
-            entity_id = options.get(entity_key, config_data.get(entity_key))
+            # Nothing will be uploaded, only keep looking for unavailable sensors
+            if unavailable:
+                continue
 
-            # Only check entities that are actually configured
-            if not sensor_id or not entity_id:
+            try:
+                value = float(state.state)
+            except ValueError as err:
+                log_debug("Could not convert %s value: %s", entity_id, err)
                 continue
 
-            state = self.hass.states.get(entity_id)
-            if state is None or state.state in ("unknown", "unavailable", None):
-                unavailable.append(entity_id)
+            # Apply unit conversions based on measurement type
+            unit = state.attributes.get("unit_of_measurement", "")
+            convert = unit_conversions.get(unit, default_conversion)
+            if convert is not None:
+                converted = convert(value)
+                if converted != value:
+                    log_debug(
+                        "Converted %s from %r: %.2f", measurement_type, unit, converted
+                    )
+                value = converted
+
+            data[sensor_id] = format(value, ".2f")
 
-        return len(unavailable) == 0, unavailable
+        return data, unavailable
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Push sensor data to OpenSenseMap API."""
         try:
-            # Check if all configured sensors are available
-            all_available, unavailable = self._all_sensors_available()
-            if not all_available:
+            # Collect values and check that all configured sensors are available
+            sensor_data, unavailable = self._collect_and_check()
+            if unavailable:
                 self.last_error = f"Sensors unavailable: {', '.join(unavailable)}"
                 _LOGGER.warning(
                     "Skipping OpenSenseMap upload - sensors unavailable: %s",
@@ -112,13 +226,10 @@ class OpenSenseMapCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 )
                 return self._get_status_data()
 
-            if self._session is None:
-                self._session = aiohttp.ClientSession()
-
-            success, response = await self._push_sensor_data()
+            success, response = await self._push_sensor_data(sensor_data)
 
             if success:
-                self.last_upload = datetime.now()
+                self.last_upload = dt_util.utcnow()
                 self.upload_count += 1
                 self.last_error = None
             else:
@@ -131,31 +242,18 @@ class OpenSenseMapCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.exception("Error pushing data to OpenSenseMap")
             return self._get_status_data()
 
-    async def _push_sensor_data(self) -> tuple[bool, str | None]:
+    async def _push_sensor_data(
+        self, sensor_data: dict[str, str]
+    ) -> tuple[bool, str | None]:
         """Push sensor data to the API."""
-        # Collect sensor values
-        sensor_data = self._collect_sensor_data()
-
         if not sensor_data:
             _LOGGER.debug("No sensor data to push")
             return True, None  # Consider it success if nothing to push
 
-        # Build URL
-        url = API_URL.format(box_id=self._box_id)
-
-        # Build headers
-        headers = {
-            "Content-Type": "application/json; charset=utf-8",
-            "User-Agent": f"{SOFTWARE_TYPE}/1.0.0",
-        }
-
-        if self._access_token:
-            headers["Authorization"] = f"Bearer {self._access_token}"
-
         if self.debug_mode:
             self.last_request_data = {
-                "url": url,
-                "headers": {k: v if k != "Authorization" else "***" for k, v in headers.items()},
+                "url": self._url,
+                "headers": self._masked_headers,
                 "payload": sensor_data,
             }
             _LOGGER.debug(
@@ -166,11 +264,11 @@ class OpenSenseMapCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         try:
             async with asyncio.timeout(HTTP_TIMEOUT):
                 async with self._session.post(
-                    url,
-                    json=sensor_data,
-                    headers=headers,
+                    self._url,
+                    data=orjson.dumps(sensor_data),
+                    headers=self._headers,
                 ) as response:
-                    if response.status in (200, 201):
+                    if response.status in _OK_STATUSES:
                         _LOGGER.debug("Successfully pushed data to OpenSenseMap")
                         return True, None
                     else:
@@ -189,71 +287,6 @@ class OpenSenseMapCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.error("Network error pushing data to OpenSenseMap: %s", err)
             return False, str(err)
 
-    def _collect_sensor_data(self) -> dict[str, str]:
-        """Collect sensor data values from Home Assistant entities."""
-        data: dict[str, str] = {}
-        config_data = self.entry.data
-        options = self.entry.options
-
-        for sensor_id_key, entity_key, label, measurement_type in SENSOR_CONFIGS:
-            # Get sensor ID and entity ID from options first, then data
-            sensor_id = options.get(sensor_id_key, config_data.get(sensor_id_key))
-            entity_id = options.get(entity_key, config_data.get(entity_key))
-
-            if not sensor_id or not entity_id:
-                continue
-
-            state = self.hass.states.get(entity_id)
-            if state is None or state.state in ("unknown", "unavailable", None):
-                _LOGGER.debug("Skipping %s: state is %s", entity_id, state)
-                continue
-
-            try:
-                value = float(state.state)
-
-                # Apply unit conversions based on measurement type
-                value = self._convert_value(measurement_type, value, state)
-
-                data[sensor_id] = f"{value:.2f}"
-
-            except (ValueError, TypeError) as err:
-                _LOGGER.debug("Could not convert %s value: %s", entity_id, err)
-
-        return data
-
-    def _convert_value(self, measurement_type: str, value: float, state: Any) -> float:
-        """Convert sensor value to the required unit."""
-        unit = state.attributes.get("unit_of_measurement", "")
-
-        # Temperature: convert Fahrenheit to Celsius
-        if measurement_type == MEASUREMENT_TEMPERATURE:
-            if unit in ("°F", "F"):
-                value = (value - 32) * 5 / 9
-                _LOGGER.debug("Converted temperature from °F to °C: %.2f", value)
-
-        # Pressure: convert to Pa
-        elif measurement_type == MEASUREMENT_PRESSURE:
-            if unit in ("hPa", "mbar", ""):
-                value = value * 100
-                _LOGGER.debug("Converted pressure from hPa to Pa: %.2f", value)
-            elif unit == "inHg":
-                value = value * 3386.39
-                _LOGGER.debug("Converted pressure from inHg to Pa: %.2f", value)
-            elif unit == "psi":
-                value = value * 6894.76
-                _LOGGER.debug("Converted pressure from psi to Pa: %.2f", value)
-            # If already in Pa, no conversion needed
-
-        # Humidity: ensure percentage (0-100)
-        elif measurement_type == MEASUREMENT_HUMIDITY:
-            if value > 1 and value <= 100:
-                pass  # Already in percentage
-            elif value <= 1:
-                value = value * 100  # Convert from decimal to percentage
-                _LOGGER.debug("Converted humidity from decimal to percentage: %.2f", value)
-
-        return value
-
     def _get_status_data(self) -> dict[str, Any]:
         """Get status data for the sensor."""
         data: dict[str, Any] = {
@@ -268,9 +301,3 @@ class OpenSenseMapCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             data["last_request"] = self.last_request_data
 
         return data
-
-    async def async_shutdown(self) -> None:
-        """Shutdown the coordinator and close the session."""
-        if self._session:
-            await self._session.close()
-            self._session = None